@@ -30,12 +30,11 @@ def commit_exists(rev: str) -> bool:
 def normalize_docs_files(raw: str) -> list[str]:
     if not raw:
         return []
-    files: list[str] = []
-    for line in raw.splitlines():
-        path = line.strip()
-        if path:
-            files.append(path)
-    return files
+    # Normalize before dropping repeats so `./docs/a.md` and `docs/a.md` are
+    # read and scanned only once.
+    return list(
+        dict.fromkeys(os.path.normpath(path) for line in raw.splitlines() if (path := line.strip()))
+    )
 
 
 def infer_base_sha(provided: str) -> str:
@@ -123,21 +122,57 @@ def extract_links(text: str, source_path: str) -> list[str]:
     return links
 
 
-def added_lines_for_file(base_sha: str, path: str) -> list[str]:
-    if base_sha:
-        diff = run_git(["diff", "--unified=0", base_sha, "HEAD", "--", path])
-        lines: list[str] = []
-        for raw_line in diff.stdout.splitlines():
-            if raw_line.startswith("+++"):
-                continue
-            if raw_line.startswith("+"):
-                lines.append(raw_line[1:])
-        return lines
+def parse_added_lines(diff_text: str) -> dict[str, list[str]]:
+    added: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    in_header = False
+    for raw_line in diff_text.splitlines():
+        if raw_line.startswith("diff --git "):
+            current, in_header = None, True
+        elif in_header and raw_line.startswith("+++ "):
+            current = added.setdefault(raw_line[4:].rstrip("\t"), [])
+        elif raw_line.startswith("@@"):
+            in_header = False
+        elif not in_header and current is not None and raw_line.startswith("+"):
+            current.append(raw_line[1:])
+    return added
 
-    file_path = Path(path)
-    if not file_path.is_file():
-        return []
-    return file_path.read_text(encoding="utf-8", errors="ignore").splitlines()
+
+def added_lines_by_file(base_sha: str, paths: list[str]) -> dict[str, list[str]]:
+    if not base_sha:
+        return {
+            path: Path(path).read_text(encoding="utf-8", errors="ignore").splitlines()
+            for path in paths
+        }
+
+    # Pin the header format so user config (diff.noprefix, color, external
+    # drivers) cannot change it, and make headers cwd-relative like pathspecs.
+    diff_args = [
+        "-c",
+        "core.quotePath=false",
+        "diff",
+        "--no-color",
+        "--no-ext-diff",
+        "--no-renames",
+        "--unified=0",
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+    ]
+    revs = [base_sha, "HEAD"]
+    # One diff for all files instead of one git process per file.
+    added = parse_added_lines(run_git([*diff_args, "--relative", *revs, "--", *paths]).stdout)
+
+    lines_by_file: dict[str, list[str]] = {}
+    for path in paths:
+        header = f"b/{os.path.relpath(path)}"
+        if header in added:
+            lines_by_file[path] = added[header]
+            continue
+        # No matching header (C-quoted name, path outside the cwd, unchanged
+        # file): diff this file on its own and take every added line.
+        single = parse_added_lines(run_git([*diff_args, *revs, "--", path]).stdout)
+        lines_by_file[path] = [line for lines in single.values() for line in lines]
+    return lines_by_file
 
 
 def main() -> int:
@@ -154,7 +189,7 @@ def main() -> int:
     base_sha = infer_base_sha(args.base)
     docs_files = infer_docs_files(base_sha, normalize_docs_files(args.docs_files))
 
-    existing_files = [path for path in docs_files if Path(path).is_file()]
+    existing_files = [path for path in docs_files if os.path.isfile(path)]
     if not existing_files:
         Path(args.output).write_text("", encoding="utf-8")
         print("No docs files available for link collection.")
@@ -162,8 +197,9 @@ def main() -> int:
 
     unique_urls: list[str] = []
     seen: set[str] = set()
+    added_lines = added_lines_by_file(base_sha, existing_files)
     for path in existing_files:
-        for line in added_lines_for_file(base_sha, path):
+        for line in added_lines[path]:
             for link in extract_links(line, path):
                 if link not in seen:
                     seen.add(link)
@@ -16,7 +16,10 @@ Options:
 import argparse
 import json
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 
 
 def parse_args():
@@ -128,11 +131,29 @@ def main():
     print("Sampling job-level timing (up to 3 runs per workflow)...")
     print()
 
+    # Job fetches are independent network calls, so run a few concurrently.
+    # Keep the pool small: unauthenticated API calls hit secondary rate limits.
+    sample_ids_by_workflow = {
+        name: stats["run_ids"][:3] for name, stats in workflow_stats.items()
+    }
+    all_sample_ids = [
+        run_id for sample_ids in sample_ids_by_workflow.values() for run_id in sample_ids
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        jobs_by_run = dict(zip(all_sample_ids, executor.map(partial(fetch_jobs, repo), all_sample_ids)))
+
+    for run_id, jobs_data in jobs_by_run.items():
+        if "jobs" not in jobs_data:
+            # Error bodies (e.g. rate limiting) must not count as zero jobs
+            print(
+                f"Warning: skipping run {run_id}: {jobs_data.get('message', 'no jobs in response')}",
+                file=sys.stderr,
+            )
+
     for name, stats in workflow_stats.items():
-        sample_ids = stats["run_ids"][:3]
+        sample_ids = [run_id for run_id in sample_ids_by_workflow[name] if "jobs" in jobs_by_run[run_id]]
         for run_id in sample_ids:
-            jobs_data = fetch_jobs(repo, run_id)
-            jobs = jobs_data.get("jobs", [])
+            jobs = jobs_by_run[run_id]["jobs"]
             for job in jobs:
                 started = job.get("started_at")
                 completed = job.get("completed_at")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Behavior tests for scripts/ci/collect_changed_links.py."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPT = Path(__file__).resolve().parents[1] / "collect_changed_links.py"
+sys.path.insert(0, str(SCRIPT.parent))
+
+import collect_changed_links  # noqa: E402
+
+
+def git(repo: Path, *args: str) -> str:
+    proc = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return proc.stdout.strip()
+
+
+class CollectChangedLinksTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = Path(tempfile.mkdtemp(prefix="zc-links-")).resolve()
+        self.addCleanup(shutil.rmtree, self.repo, ignore_errors=True)
+        git(self.repo, "init", "-q")
+        git(self.repo, "config", "user.name", "Test User")
+        git(self.repo, "config", "user.email", "test@example.com")
+
+        (self.repo / "docs").mkdir()
+        self.files = {
+            "docs/guide.md": "https://example.com/guide",
+            'docs/say "hi".md': "https://example.com/quoted",
+            "docs/with space.md": "https://example.com/space",
+        }
+        for name in self.files:
+            (self.repo / name).write_text("# Title\n", encoding="utf-8")
+        git(self.repo, "add", ".")
+        git(self.repo, "commit", "-q", "-m", "base")
+        self.base = git(self.repo, "rev-parse", "HEAD")
+
+        for name, url in self.files.items():
+            with (self.repo / name).open("a", encoding="utf-8") as handle:
+                handle.write(f"See {url}\n++ also https://example.com/plus\n")
+        git(self.repo, "commit", "-q", "-am", "head")
+
+    def collect(self, docs_files: list[str], cwd: Path | None = None) -> set[str]:
+        output = self.repo / "links.txt"
+        subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPT),
+                "--base",
+                self.base,
+                "--docs-files",
+                "\n".join(docs_files),
+                "--output",
+                str(output),
+            ],
+            cwd=cwd or self.repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return set(output.read_text(encoding="utf-8").split())
+
+    def expected(self) -> set[str]:
+        return {*self.files.values(), "https://example.com/plus"}
+
+    def test_collects_links_from_all_changed_files(self) -> None:
+        self.assertEqual(self.collect(list(self.files)), self.expected())
+
+    def test_ignores_diff_noprefix_config(self) -> None:
+        git(self.repo, "config", "diff.noprefix", "true")
+        self.assertEqual(self.collect(list(self.files)), self.expected())
+
+    def test_accepts_absolute_paths(self) -> None:
+        paths = [str(self.repo / name) for name in self.files]
+        self.assertEqual(self.collect(paths), self.expected())
+
+    def test_runs_from_subdirectory(self) -> None:
+        paths = [name.removeprefix("docs/") for name in self.files]
+        self.assertEqual(self.collect(paths, cwd=self.repo / "docs"), self.expected())
+
+
+class NormalizeDocsFilesTest(unittest.TestCase):
+    def test_drops_equivalent_spellings_of_same_file(self) -> None:
+        raw = "./docs/a.md\n\n docs/a.md \ndocs//b.md\ndocs/x/../a.md\ndocs/b.md\n"
+        self.assertEqual(collect_changed_links.normalize_docs_files(raw), ["docs/a.md", "docs/b.md"])
+
+    def test_empty_input(self) -> None:
+        self.assertEqual(collect_changed_links.normalize_docs_files(""), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)